@@ -16,7 +16,8 @@
 import copy
 import logging
 import warnings
-from typing import Any, Callable, Dict, List, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple, Union
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.constants import (
@@ -80,11 +81,20 @@ from ludwig.types import (
     TrainingSetMetadataDict,
 )
 from ludwig.utils.metric_utils import TrainerMetric
-from ludwig.utils.misc_utils import get_from_registry, merge_dict
+from ludwig.utils.misc_utils import get_from_registry, merge_dict_in_place
 from ludwig.utils.version_transformation import VersionTransformation, VersionTransformationRegistry
 
 config_transformation_registry = VersionTransformationRegistry()
 
+# Deprecation messages (and their format args) already emitted by this process, see `_warn_deprecated_once`.
+_issued_deprecation_warnings: Set[Tuple[str, Tuple[str, ...]]] = set()
+
+_TRAINING_SECTION_DEPRECATION = 'Config section "training" renamed to "trainer" and will be removed in v0.6'
+_AUDIO_FEATURE_DEPRECATION = (
+    "Parameters specified at the `audio_feature` parameter level have been unnested and should now be specified at "
+    "the preprocessing level. Support for `audio_feature` will be removed in v0.7"
+)
+
 
 @DeveloperAPI
 def register_config_transformation(version: str, prefixes: Union[str, List[str]] = []) -> Callable:
@@ -109,6 +119,34 @@ def register_config_transformation(version: str, prefixes: Union[str, List[str]]
     return wrap
 
 
+def _warn_deprecated_once(message: str, *args: Any):
+    """Emits message, %-formatted with args, as a DeprecationWarning at most once per process.
+
+    Upgrades run for every feature, nested dict and hyperopt trial, so the same deprecation would otherwise be reported
+    (and go through the warnings machinery) many times for a single config. The message is only formatted when the
+    warning is actually emitted. Args are keyed by their string form, as they may come from a malformed config and not
+    be hashable.
+    """
+    key = (message, tuple(map(str, args)))
+    if key in _issued_deprecation_warnings:
+        return
+    _issued_deprecation_warnings.add(key)
+    warnings.warn(message % args if args else message, DeprecationWarning, stacklevel=2)
+
+
+@lru_cache(maxsize=1)
+def _get_preprocessing_feature_type_keys() -> Tuple[Tuple[str, str], ...]:
+    """Returns (key, feature type) pairs for the type-specific sections which may appear in a legacy preprocessing
+    config, in registry order followed by the "numerical" alias of "number"."""
+    return tuple((feature_type, feature_type) for feature_type in get_base_type_registry()) + (("numerical", NUMBER),)
+
+
+@lru_cache(maxsize=1)
+def _get_preprocessing_feature_type_key_set() -> FrozenSet[str]:
+    """Returns the keys of _get_preprocessing_feature_type_keys() as a set for fast membership tests."""
+    return frozenset(key for key, _ in _get_preprocessing_feature_type_keys())
+
+
 @DeveloperAPI
 def upgrade_config_dict_to_latest_version(config: ModelConfigDict) -> ModelConfigDict:
     """Updates config from an older version of Ludwig to the current version. If config does not have a
@@ -120,9 +158,41 @@ def upgrade_config_dict_to_latest_version(config: ModelConfigDict) -> ModelConfi
     Returns A new copy of config, upgraded to the current Ludwig version. Returns config if config has no
             "ludwig_version".
     """
-    return config_transformation_registry.update_config(
-        config, from_version=config.get("ludwig_version", "0.0"), to_version=LUDWIG_VERSION
-    )
+    return _upgrade_config_dict(config, {})
+
+
+@DeveloperAPI
+def upgrade_config_dicts_to_latest_version(configs: Iterable[ModelConfigDict]) -> List[ModelConfigDict]:
+    """Updates a batch of configs, i.e. the trial configs of a hyperopt sweep, to the current version.
+
+    Equivalent to calling `upgrade_config_dict_to_latest_version` on each config, but the list of transformations is
+    only computed once for each "ludwig_version" in the batch.
+
+    Args:
+        configs: Configs saved by older versions of Ludwig.
+
+    Returns A list of new copies of configs, upgraded to the current Ludwig version.
+    """
+    transformations_by_version = {}
+    return [_upgrade_config_dict(config, transformations_by_version) for config in configs]
+
+
+def _upgrade_config_dict(
+    config: ModelConfigDict, transformations_by_version: Dict[str, List[VersionTransformation]]
+) -> ModelConfigDict:
+    """Upgrades config to the current version.
+
+    Args:
+        config: A config saved by an older version of Ludwig.
+        transformations_by_version: Maps "ludwig_version" to the transformations to apply to configs of that version.
+                                    Filled in as new versions are seen, so it can be shared by a batch of configs.
+    """
+    from_version = config.get("ludwig_version", "0.0")
+    transformations = transformations_by_version.get(from_version)
+    if transformations is None:
+        transformations = config_transformation_registry.get_transformations(from_version, LUDWIG_VERSION)
+        transformations_by_version[from_version] = transformations
+    return config_transformation_registry.apply_transformations(config, transformations, LUDWIG_VERSION)
 
 
 def upgrade_model_progress(model_progress: Dict) -> Dict:
@@ -204,18 +274,24 @@ def upgrade_model_progress(model_progress: Dict) -> Dict:
     return ret
 
 
-def _traverse_dicts(config: Any, f: Callable[[Dict], None]):
-    """Recursively applies function f to every dictionary contained in config.
+def _iter_dicts(config: Any) -> Iterator[Dict]:
+    """Yields every dictionary contained in config, including config itself if it is a dictionary.
 
-    f should in-place modify the config dict. f will be called on leaves first, root last.
+    Parents are yielded before their children. Callers may modify a yielded dict in-place, as its values are only read
+    once iteration is resumed.
+
+    Configs are parsed from YAML/JSON or built by hand, so they only contain plain dicts and lists. Exact type checks
+    are used instead of isinstance since this runs for every node of the config; subclasses are not traversed.
     """
-    if isinstance(config, dict):
-        for k, v in config.items():
-            _traverse_dicts(v, f)
-        f(config)
-    elif isinstance(config, list):
-        for v in config:
-            _traverse_dicts(v, f)
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict:
+            yield node
+            stack.extend(node.values())
+        elif node_type is list:
+            stack.extend(node)
 
 
 @register_config_transformation("0.6", "backend")
@@ -225,9 +301,7 @@ def _update_backend_cache_credentials(backend: Dict[str, Any]) -> Dict[str, Any]
         if "cache" in credentials:
             warnings.warn("`cache` already found in `backend.credentials`, ignoring `cache_credentials`")
         else:
-            warnings.warn(
-                "`backend.cache_credentials` has been renamed `backend.credentials.cache`", DeprecationWarning
-            )
+            _warn_deprecated_once("`backend.cache_credentials` has been renamed `backend.credentials.cache`")
             credentials["cache"] = backend.pop("cache_credentials")
         backend["credentials"] = credentials
     return backend
@@ -266,16 +340,14 @@ def _update_level_metadata(config: ModelConfigDict) -> ModelConfigDict:
         for key, value in drop_params.items():
             if key in params:
                 if value in params:
-                    warnings.warn(
-                        f"Removing deprecated config preprocessing parameter {key} as new param {value} already "
-                        f"present in the config",
-                        DeprecationWarning,
+                    _warn_deprecated_once(
+                        "Removing deprecated config preprocessing parameter %s as new param %s already present in "
+                        "the config",
+                        key,
+                        value,
                     )
                 else:
-                    warnings.warn(
-                        f"Renaming deprecated config preprocessing parameter {key} to {value}",
-                        DeprecationWarning,
-                    )
+                    _warn_deprecated_once("Renaming deprecated config preprocessing parameter %s to %s", key, value)
                     params[value] = params[key]
                 del params[key]
 
@@ -296,50 +368,52 @@ def _update_level_metadata(config: ModelConfigDict) -> ModelConfigDict:
 @register_config_transformation("0.5")
 def rename_training_to_trainer(config: ModelConfigDict) -> ModelConfigDict:
     if TRAINING in config:
-        warnings.warn('Config section "training" renamed to "trainer" and will be removed in v0.6', DeprecationWarning)
+        _warn_deprecated_once(_TRAINING_SECTION_DEPRECATION)
         config[TRAINER] = config[TRAINING]
         del config[TRAINING]
     return config
 
 
+# Maps deprecated bias parameter names to their replacements, with the warning to emit on rename.
+_BIAS_RENAMES = tuple(
+    (old, new, f'Parameter "{old}" renamed to "{new}" and will be removed in v0.6')
+    for old, new in ((BIAS, USE_BIAS), (CONV_BIAS, CONV_USE_BIAS), (DEFAULT_BIAS, DEFAULT_USE_BIAS))
+)
+
+_BIAS_KEYS = frozenset(old for old, _, _ in _BIAS_RENAMES)
+
+_SENTINEL = object()
+
+
+def _upgrade_use_bias(config: Dict[str, Any]):
+    """Renames deprecated bias parameters in a single config dict (in-place)."""
+    for old, new, message in _BIAS_RENAMES:
+        value = config.pop(old, _SENTINEL)
+        if value is not _SENTINEL:
+            _warn_deprecated_once(message)
+            config[new] = value
+
+
 @register_config_transformation("0.5", ["input_features", "output_features"])
 def _upgrade_use_bias_in_features(feature: FeatureConfigDict) -> FeatureConfigDict:
-    def upgrade_use_bias(config):
-        if BIAS in config:
-            warnings.warn('Parameter "bias" renamed to "use_bias" and will be removed in v0.6', DeprecationWarning)
-            config[USE_BIAS] = config[BIAS]
-            del config[BIAS]
-        if CONV_BIAS in config:
-            warnings.warn(
-                'Parameter "conv_bias" renamed to "conv_use_bias" and will be removed in v0.6', DeprecationWarning
-            )
-            config[CONV_USE_BIAS] = config[CONV_BIAS]
-            del config[CONV_BIAS]
-        if DEFAULT_BIAS in config:
-            warnings.warn(
-                'Parameter "default_bias" renamed to "default_use_bias" and will be removed in v0.6', DeprecationWarning
-            )
-            config[DEFAULT_USE_BIAS] = config[DEFAULT_BIAS]
-            del config[DEFAULT_BIAS]
-
-    _traverse_dicts(feature, upgrade_use_bias)
+    for config in _iter_dicts(feature):
+        # Most dicts have no deprecated bias params, so only a key set comparison is paid for them.
+        if not _BIAS_KEYS.isdisjoint(config.keys()):
+            _upgrade_use_bias(config)
     return feature
 
 
 @register_config_transformation("0.5", ["input_features", "output_features"])
 def _upgrade_feature(feature: FeatureConfigDict) -> FeatureConfigDict:
     """Upgrades feature config (in-place)"""
-    if feature.get(TYPE) == "numerical":
-        warnings.warn('Feature type "numerical" renamed to "number" and will be removed in v0.6', DeprecationWarning)
-        feature[TYPE] = NUMBER
-    if feature.get(TYPE) == AUDIO:
+    feature_type = feature.get(TYPE)
+    if feature_type == "numerical":
+        _warn_deprecated_once('Feature type "numerical" renamed to "number" and will be removed in v0.6')
+        feature_type = feature[TYPE] = NUMBER
+    if feature_type == AUDIO:
         if PREPROCESSING in feature:
             feature[PREPROCESSING] = upgrade_audio_preprocessing(feature[PREPROCESSING])
-        warnings.warn(
-            "Parameters specified at the `audio_feature` parameter level have been unnested and should now "
-            "be specified at the preprocessing level. Support for `audio_feature` will be removed in v0.7",
-            DeprecationWarning,
-        )
+        _warn_deprecated_once(_AUDIO_FEATURE_DEPRECATION)
     return feature
 
 
@@ -425,80 +499,79 @@ def _upgrade_encoder_decoder_params(feature: FeatureConfigDict, input_feature: b
         del feature[k]
 
     if warn:
-        warnings.warn(
-            f"{module_type} specific parameters should now be nested within a dictionary under the '{module_type}' "
-            f"parameter. Support for un-nested {module_type} specific parameters will be removed in v0.7",
-            DeprecationWarning,
+        _warn_deprecated_once(
+            "%s specific parameters should now be nested within a dictionary under the '%s' parameter. Support for "
+            "un-nested %s specific parameters will be removed in v0.7",
+            module_type,
+            module_type,
+            module_type,
         )
     return feature
 
 
+_EXECUTOR_TYPE_DEPRECATION = 'executor type "%s" not supported, converted to "ray" will be flagged as error in v0.6'
+_SAMPLER_DEPRECATION = (
+    f'"{SAMPLER}" is no longer supported, converted to "{SEARCH_ALG}". "{SAMPLER}" will be flagged as error in v0.6'
+)
+
+# Hyperopt parameter prefixes of the legacy "training" section and its replacement.
+_TRAINING_PREFIX = f"{TRAINING}."
+_TRAINING_PREFIX_LEN = len(_TRAINING_PREFIX)
+_TRAINER_PREFIX = f"{TRAINER}."
+
+
 @register_config_transformation("0.5", ["hyperopt"])
 def _upgrade_hyperopt(hyperopt: HyperoptConfigDict) -> HyperoptConfigDict:
     """Upgrades hyperopt config (in-place)"""
     # check for use of legacy "training" reference, if any found convert to "trainer"
     if PARAMETERS in hyperopt:
         hparams = hyperopt[PARAMETERS]
-        for k, v in list(hparams.items()):
-            substr = "training."
-            if k.startswith(substr):
-                warnings.warn(
-                    'Config section "training" renamed to "trainer" and will be removed in v0.6', DeprecationWarning
-                )
-                hparams["trainer." + k[len(substr) :]] = v
-                del hparams[k]
+        renamed_params = [k for k in hparams if k.startswith(_TRAINING_PREFIX)]
+        if renamed_params:
+            _warn_deprecated_once(_TRAINING_SECTION_DEPRECATION)
+            for k in renamed_params:
+                hparams[_TRAINER_PREFIX + k[_TRAINING_PREFIX_LEN:]] = hparams.pop(k)
 
     # check for legacy parameters in "executor"
     if EXECUTOR in hyperopt:
         hpexecutor = hyperopt[EXECUTOR]
         executor_type = hpexecutor.get(TYPE, None)
         if executor_type is not None and executor_type != RAY:
-            warnings.warn(
-                f'executor type "{executor_type}" not supported, converted to "ray" will be flagged as error '
-                "in v0.6",
-                DeprecationWarning,
-            )
+            _warn_deprecated_once(_EXECUTOR_TYPE_DEPRECATION, executor_type)
             hpexecutor[TYPE] = RAY
 
         # if search_alg not at top level and is present in executor, promote to top level
         if SEARCH_ALG in hpexecutor:
+            search_alg = hpexecutor.pop(SEARCH_ALG)
             # promote only if not in top-level, otherwise use current top-level
             if SEARCH_ALG not in hyperopt:
-                hyperopt[SEARCH_ALG] = hpexecutor[SEARCH_ALG]
-                if isinstance(hyperopt[SEARCH_ALG], str):
-                    hyperopt[SEARCH_ALG] = {TYPE: hyperopt[SEARCH_ALG]}
-            del hpexecutor[SEARCH_ALG]
+                hyperopt[SEARCH_ALG] = {TYPE: search_alg} if isinstance(search_alg, str) else search_alg
     else:
-        warnings.warn(
-            'Missing "executor" section, adding "ray" executor will be flagged as error in v0.6', DeprecationWarning
-        )
+        _warn_deprecated_once('Missing "executor" section, adding "ray" executor will be flagged as error in v0.6')
         hyperopt[EXECUTOR] = {TYPE: RAY}
 
     # check for legacy "sampler" section
     if SAMPLER in hyperopt:
-        warnings.warn(
-            f'"{SAMPLER}" is no longer supported, converted to "{SEARCH_ALG}". "{SAMPLER}" will be flagged as '
-            "error in v0.6",
-            DeprecationWarning,
-        )
-        if SEARCH_ALG in hyperopt[SAMPLER]:
+        _warn_deprecated_once(_SAMPLER_DEPRECATION)
+        hpsampler = hyperopt[SAMPLER]
+        hpexecutor = hyperopt[EXECUTOR]
+        if SEARCH_ALG in hpsampler:
             if SEARCH_ALG not in hyperopt:
-                hyperopt[SEARCH_ALG] = hyperopt[SAMPLER][SEARCH_ALG]
-                if isinstance(hyperopt[SEARCH_ALG], str):
-                    hyperopt[SEARCH_ALG] = {TYPE: hyperopt[SEARCH_ALG]}
-                warnings.warn('Moved "search_alg" to hyperopt config top-level', DeprecationWarning)
+                search_alg = hpsampler[SEARCH_ALG]
+                hyperopt[SEARCH_ALG] = {TYPE: search_alg} if isinstance(search_alg, str) else search_alg
+                _warn_deprecated_once('Moved "search_alg" to hyperopt config top-level')
 
         # if num_samples or scheduler exist in SAMPLER move to EXECUTOR Section
-        if NUM_SAMPLES in hyperopt[SAMPLER] and NUM_SAMPLES not in hyperopt[EXECUTOR]:
-            hyperopt[EXECUTOR][NUM_SAMPLES] = hyperopt[SAMPLER][NUM_SAMPLES]
-            warnings.warn('Moved "num_samples" from "sampler" to "executor"', DeprecationWarning)
+        if NUM_SAMPLES in hpsampler and NUM_SAMPLES not in hpexecutor:
+            hpexecutor[NUM_SAMPLES] = hpsampler[NUM_SAMPLES]
+            _warn_deprecated_once('Moved "num_samples" from "sampler" to "executor"')
 
-        if SCHEDULER in hyperopt[SAMPLER] and SCHEDULER not in hyperopt[EXECUTOR]:
-            hyperopt[EXECUTOR][SCHEDULER] = hyperopt[SAMPLER][SCHEDULER]
-            warnings.warn('Moved "scheduler" from "sampler" to "executor"', DeprecationWarning)
+        if SCHEDULER in hpsampler and SCHEDULER not in hpexecutor:
+            hpexecutor[SCHEDULER] = hpsampler[SCHEDULER]
+            _warn_deprecated_once('Moved "scheduler" from "sampler" to "executor"')
 
-        if SCHEDULER in hyperopt[EXECUTOR] and len(hyperopt[EXECUTOR][SCHEDULER].keys()) == 0:
-            del hyperopt[EXECUTOR][SCHEDULER]
+        if SCHEDULER in hpexecutor and len(hpexecutor[SCHEDULER].keys()) == 0:
+            del hpexecutor[SCHEDULER]
 
         # remove legacy section
         del hyperopt[SAMPLER]
@@ -506,9 +579,8 @@ def _upgrade_hyperopt(hyperopt: HyperoptConfigDict) -> HyperoptConfigDict:
     if SEARCH_ALG not in hyperopt:
         # make top-level as search_alg, if missing put in default value
         hyperopt[SEARCH_ALG] = {TYPE: "variant_generator"}
-        warnings.warn(
-            'Missing "search_alg" at hyperopt top-level, adding in default value, will be flagged as error ' "in v0.6",
-            DeprecationWarning,
+        _warn_deprecated_once(
+            'Missing "search_alg" at hyperopt top-level, adding in default value, will be flagged as error in v0.6'
         )
     return hyperopt
 
@@ -518,39 +590,46 @@ def _upgrade_trainer(trainer: TrainerConfigDict) -> TrainerConfigDict:
     """Upgrades trainer config (in-place)"""
     eval_batch_size = trainer.get(EVAL_BATCH_SIZE)
     if eval_batch_size == 0:
-        warnings.warn(
-            "`trainer.eval_batch_size` value `0` changed to `None`, will be unsupported in v0.6", DeprecationWarning
-        )
+        _warn_deprecated_once("`trainer.eval_batch_size` value `0` changed to `None`, will be unsupported in v0.6")
         trainer[EVAL_BATCH_SIZE] = None
     return trainer
 
 
+_PREPROCESSING_DEFAULTS_DEPRECATION = (
+    "Moving preprocessing configuration for `%s` feature type from `preprocessing` section to `defaults` section in "
+    "Ludwig config. This will be unsupported in v0.8."
+)
+
+
 @register_config_transformation("0.5")
 def _upgrade_preprocessing_defaults(config: ModelConfigDict) -> ModelConfigDict:
     """Move feature-specific preprocessing parameters into defaults in config (in-place)"""
-    type_specific_preprocessing_params = dict()
+    # Return early for the common case of a preprocessing section which is absent or only has global parameters.
+    preprocessing = config.get(PREPROCESSING)
+    if preprocessing is None or (
+        preprocessing and _get_preprocessing_feature_type_key_set().isdisjoint(preprocessing.keys())
+    ):
+        return config
 
-    # If preprocessing section specified and it contains feature specific preprocessing parameters,
-    # make a copy and delete it from the preprocessing section
-    for parameter in list(config.get(PREPROCESSING, {})):
-        if parameter in get_base_type_registry():
-            warnings.warn(
-                f"Moving preprocessing configuration for `{parameter}` feature type from `preprocessing` section"
-                " to `defaults` section in Ludwig config. This will be unsupported in v0.8.",
-                DeprecationWarning,
-            )
-            type_specific_preprocessing_params[parameter] = config[PREPROCESSING].pop(parameter)
+    type_specific_preprocessing_params = dict()
 
-        if parameter == "numerical":
+    # If preprocessing section contains feature specific preprocessing parameters, move them out of the
+    # preprocessing section.
+    for parameter, feature_type in _get_preprocessing_feature_type_keys():
+        preprocessing_param = preprocessing.pop(parameter, _SENTINEL)
+        if preprocessing_param is _SENTINEL:
+            continue
+        _warn_deprecated_once(_PREPROCESSING_DEFAULTS_DEPRECATION, parameter)
+        if feature_type in type_specific_preprocessing_params:
+            # "number" is visited before its "numerical" alias, so the current name takes precedence.
             warnings.warn(
-                f"Moving preprocessing configuration for `{parameter}` feature type from `preprocessing` section"
-                " to `defaults` section in Ludwig config. This will be unsupported in v0.8.",
-                DeprecationWarning,
+                f"`preprocessing.{feature_type}` config param already set. Discarding `preprocessing.{parameter}`."
             )
-            type_specific_preprocessing_params[NUMBER] = config[PREPROCESSING].pop(parameter)
+            continue
+        type_specific_preprocessing_params[feature_type] = preprocessing_param
 
     # Delete empty preprocessing section if no other preprocessing parameters specified
-    if PREPROCESSING in config and not config[PREPROCESSING]:
+    if not preprocessing:
         del config[PREPROCESSING]
 
     # Update defaults with the default feature specific preprocessing parameters
@@ -570,9 +649,7 @@ def _upgrade_preprocessing_defaults(config: ModelConfigDict) -> ModelConfigDict:
             defaults[feature_type][PREPROCESSING] = preprocessing_param
         # Update default feature specific preprocessing with parameters from config
         else:
-            defaults[feature_type][PREPROCESSING].update(
-                merge_dict(defaults[feature_type][PREPROCESSING], preprocessing_param)
-            )
+            merge_dict_in_place(defaults[feature_type][PREPROCESSING], preprocessing_param)
 
     if defaults:
         config[DEFAULTS] = defaults
@@ -591,27 +668,24 @@ def _upgrade_preprocessing_split(preprocessing: PreprocessingConfigDict) -> Prep
 
     if split_probabilities is not None:
         split_params[PROBABILITIES] = split_probabilities
-        warnings.warn(
+        _warn_deprecated_once(
             "`preprocessing.split_probabilities` has been replaced by `preprocessing.split.probabilities`, "
-            "will be flagged as error in v0.7",
-            DeprecationWarning,
+            "will be flagged as error in v0.7"
         )
 
     if stratify is not None:
         split_params[TYPE] = STRATIFY
         split_params[COLUMN] = stratify
-        warnings.warn(
+        _warn_deprecated_once(
             "`preprocessing.stratify` has been replaced by `preprocessing.split.column` "
             'when setting `preprocessing.split.type` to "stratify", '
-            "will be flagged as error in v0.7",
-            DeprecationWarning,
+            "will be flagged as error in v0.7"
         )
 
     if force_split is not None:
-        warnings.warn(
+        _warn_deprecated_once(
             "`preprocessing.force_split` has been replaced by `preprocessing.split.type`, "
-            "will be flagged as error in v0.7",
-            DeprecationWarning,
+            "will be flagged as error in v0.7"
         )
 
         if TYPE not in split_params:
@@ -625,18 +699,14 @@ def _upgrade_preprocessing_split(preprocessing: PreprocessingConfigDict) -> Prep
             for k, v in preprocessing[AUDIO]["audio_feature"].items():
                 preprocessing[AUDIO][k] = v
             del preprocessing[AUDIO]["audio_feature"]
-        warnings.warn(
-            "Parameters specified at the `audio_feature` parameter level have been unnested and should now "
-            "be specified at the preprocessing level. Support for `audio_feature` will be removed in v0.7",
-            DeprecationWarning,
-        )
+        _warn_deprecated_once(_AUDIO_FEATURE_DEPRECATION)
     return preprocessing
 
 
 @register_config_transformation("0.5")
 def update_training(config: ModelConfigDict) -> ModelConfigDict:
     if TRAINING in config:
-        warnings.warn('Config section "training" renamed to "trainer" and will be removed in v0.6', DeprecationWarning)
+        _warn_deprecated_once(_TRAINING_SECTION_DEPRECATION)
         config[TRAINER] = config[TRAINING]
         del config[TRAINING]
     return config
@@ -662,10 +732,8 @@ def upgrade_missing_value_strategy(config: ModelConfigDict) -> ModelConfigDict:
 @register_config_transformation("0.6", ["trainer"])
 def _upgrade_max_batch_size(trainer: TrainerConfigDict) -> TrainerConfigDict:
     if "increase_batch_size_on_plateau_max" in trainer:
-        warnings.warn(
-            'Config param "increase_batch_size_on_plateau_max" renamed to "max_batch_size" and will be '
-            "removed in v0.8",
-            DeprecationWarning,
+        _warn_deprecated_once(
+            'Config param "increase_batch_size_on_plateau_max" renamed to "max_batch_size" and will be removed in v0.8'
         )
         increase_batch_size_on_plateau_max_val = trainer.pop("increase_batch_size_on_plateau_max")
         if "max_batch_size" in trainer:
@@ -682,10 +750,9 @@ def _upgrade_max_batch_size(trainer: TrainerConfigDict) -> TrainerConfigDict:
 @register_config_transformation("0.6", ["trainer"])
 def remove_trainer_type(trainer: TrainerConfigDict) -> TrainerConfigDict:
     if TYPE in trainer:
-        warnings.warn(
+        _warn_deprecated_once(
             "Config param `type` has been removed from the trainer. The trainer type is determined by the top level "
-            " `model_type` parameter. Support for the `type` params in trainer will be removed in v0.8",
-            DeprecationWarning,
+            " `model_type` parameter. Support for the `type` params in trainer will be removed in v0.8"
         )
         del trainer[TYPE]
 
@@ -710,9 +777,8 @@ def learning_rate_scheduler(trainer: TrainerConfigDict) -> TrainerConfigDict:
     lr_scheduler = trainer.get("learning_rate_scheduler", {})
     for old_key, new_key in key_mapping.items():
         if old_key in trainer:
-            warnings.warn(
-                f"Config param `trainer.{old_key}` has been moved to `trainer.learning_rate_scheduler.{new_key}`.",
-                DeprecationWarning,
+            _warn_deprecated_once(
+                "Config param `trainer.%s` has been moved to `trainer.learning_rate_scheduler.%s`.", old_key, new_key
             )
             if new_key in lr_scheduler:
                 warnings.warn(
@@ -775,11 +841,15 @@ def _upgrade_legacy_image_encoders(feature: FeatureConfigDict) -> FeatureConfigD
                 f"Please remove features unique to one of these encoder types from your configuration."
             )
 
-        warnings.warn(
-            f"Encoder '{encoder_type}' with params '{user_legacy_fields}' has been renamed to "
-            f"'{encoder_mapping[encoder_type]}'. Please upgrade your config to use the new '{encoder_type}' as "
-            f"support for '{encoder_mapping[encoder_type]}' is not guaranteed past v0.8.",
-            DeprecationWarning,
+        legacy_encoder_type = encoder_mapping[encoder_type]
+        _warn_deprecated_once(
+            "Encoder '%s' with params '%s' has been renamed to '%s'. Please upgrade your config to use the new '%s' "
+            "as support for '%s' is not guaranteed past v0.8.",
+            encoder_type,
+            user_legacy_fields,
+            legacy_encoder_type,
+            encoder_type,
+            legacy_encoder_type,
         )
 
         # User provided legacy fields and no new fields, so we assume they intended to use the legacy encoder
@@ -793,9 +863,8 @@ def upgrade_missing_hyperopt(config: ModelConfigDict) -> ModelConfigDict:
     hyperopt = config.get(HYPEROPT)
     if hyperopt == {}:
         # This is a deprecated form of providing a missing hyperopt section, as it violates the schema definition
-        warnings.warn(
-            "Config section `hyperopt: {}` is deprecated, please set `hyperopt: null` to disable hyperopt.",
-            DeprecationWarning,
+        _warn_deprecated_once(
+            "Config section `hyperopt: {}` is deprecated, please set `hyperopt: null` to disable hyperopt."
         )
         del config[HYPEROPT]
     return config
@@ -837,10 +906,13 @@ def _update_old_missing_value_strategy(feature_config: FeatureConfigDict):
     missing_value_strategy = feature_config.get(PREPROCESSING).get(MISSING_VALUE_STRATEGY)
     replacement_strategy = "bfill" if missing_value_strategy == "backfill" else "ffill"
     feature_name = feature_config.get(NAME)
-    warnings.warn(
-        f"Using `{replacement_strategy}` instead of `{missing_value_strategy}` as the missing value strategy"
-        f" for `{feature_name}`. These are identical. `{missing_value_strategy}` will be removed in v0.8",
-        DeprecationWarning,
+    _warn_deprecated_once(
+        "Using `%s` instead of `%s` as the missing value strategy for `%s`. These are identical. `%s` will be removed "
+        "in v0.8",
+        replacement_strategy,
+        missing_value_strategy,
+        feature_name,
+        missing_value_strategy,
     )
     feature_config[PREPROCESSING].update({MISSING_VALUE_STRATEGY: replacement_strategy})
 
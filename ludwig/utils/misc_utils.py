@@ -65,6 +65,22 @@ def merge_dict(dct, merge_dct):
     return dct
 
 
+@DeveloperAPI
+def merge_dict_in_place(dct, merge_dct):
+    """Recursive dict merge like :meth:``merge_dict``, but ``merge_dct`` is merged into ``dct`` in-place instead of
+    into a copy of it.
+
+    :param dct: dict onto which the merge is executed
+    :param merge_dct: dct merged into dct
+    :return: None
+    """
+    for k, v in merge_dct.items():
+        if k in dct and isinstance(dct[k], dict) and isinstance(v, Mapping):
+            merge_dict_in_place(dct[k], v)
+        else:
+            dct[k] = v
+
+
 @DeveloperAPI
 def sum_dicts(dicts, dict_type=dict):
     summed_dict = dict_type()
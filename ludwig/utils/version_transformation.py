@@ -164,6 +164,21 @@ class VersionTransformationRegistry:
         Returns The updated config after applying update transformations and updating the "ludwig_version" key.
         """
         transformations = self.get_transformations(from_version, to_version)
+        return self.apply_transformations(config, transformations, to_version)
+
+    def apply_transformations(
+        self, config: Dict, transformations: List[VersionTransformation], to_version: str
+    ) -> Dict:
+        """Applies a list of transformations, as returned by get_transformations, to a copy of config. Useful to
+        update many configs without recomputing the transformations for each one.
+
+        Args:
+            config: The config to update.
+            transformations: The ordered list of transformations to apply.
+            to_version: The version of ludwig the transformations update to (usually the current LUDWIG_VERSION).
+
+        Returns The updated config after applying transformations and updating the "ludwig_version" key.
+        """
         updated_config = copy.deepcopy(config)
         for t in transformations:
             updated_config = t.transform_config(updated_config)
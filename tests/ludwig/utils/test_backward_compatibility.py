@@ -1,5 +1,6 @@
 import copy
 import math
+import warnings
 from typing import Any, Dict
 
 import pytest
@@ -21,19 +22,27 @@ from ludwig.constants import (
     SCHEDULER,
     SPLIT,
     TRAINER,
+    TRAINING,
     TYPE,
 )
+from ludwig.globals import LUDWIG_VERSION
 from ludwig.schema.model_config import ModelConfig
 from ludwig.schema.trainer import ECDTrainerConfig
+from ludwig.utils import backward_compatibility
 from ludwig.utils.backward_compatibility import (
     _update_backend_cache_credentials,
     _upgrade_encoder_decoder_params,
     _upgrade_feature,
+    _upgrade_hyperopt,
+    _upgrade_preprocessing_defaults,
     _upgrade_preprocessing_split,
+    _upgrade_use_bias_in_features,
     upgrade_config_dict_to_latest_version,
+    upgrade_config_dicts_to_latest_version,
     upgrade_missing_value_strategy,
     upgrade_model_progress,
 )
+from ludwig.utils.misc_utils import merge_dict
 from ludwig.utils.trainer_utils import TrainerMetric
 
 
@@ -824,3 +833,165 @@ def test_load_config_missing_hyperopt():
     config_obj = ModelConfig.from_dict(old_valid_config)
     assert config_obj.hyperopt is None
     assert config_obj.to_dict()[HYPEROPT] is None
+
+
+def test_deprecation_warning_emitted_once(monkeypatch):
+    monkeypatch.setattr(backward_compatibility, "_issued_deprecation_warnings", set())
+
+    features = [
+        {"name": "num_in", "type": "number", "encoder": {"bias": True}},
+        {"name": "text_in", "type": "text", "encoder": {"bias": False, "fc_layers": [{"bias": True}]}},
+    ]
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        for feature in features:
+            _upgrade_use_bias_in_features(feature)
+
+    assert features[0]["encoder"] == {"use_bias": True}
+    assert features[1]["encoder"] == {"use_bias": False, "fc_layers": [{"use_bias": True}]}
+    assert len([w for w in record if issubclass(w.category, DeprecationWarning)]) == 1
+
+
+def test_upgrade_config_dict_returns_independent_copies():
+    config = {
+        INPUT_FEATURES: [{"name": "num_in", "type": "numerical"}],
+        OUTPUT_FEATURES: [{"name": "num_out", "type": "number"}],
+        "training": {"epochs": 2},
+    }
+    original_config = copy.deepcopy(config)
+
+    first_config = upgrade_config_dict_to_latest_version(config)
+    first_config[TRAINER]["epochs"] = 100
+    second_config = upgrade_config_dict_to_latest_version(config)
+
+    assert config == original_config
+    assert second_config[TRAINER]["epochs"] == 2
+    assert second_config[INPUT_FEATURES][0][TYPE] == NUMBER
+
+
+def test_upgrade_hyperopt_training_parameters_warns_once(monkeypatch):
+    monkeypatch.setattr(backward_compatibility, "_issued_deprecation_warnings", set())
+
+    param_names = ["learning_rate", "batch_size", "epochs", "optimizer.type"]
+    hyperopt = {
+        "parameters": {f"training.{name}": {"space": "choice", "categories": [1, 2]} for name in param_names},
+        EXECUTOR: {TYPE: "ray"},
+        "search_alg": {TYPE: "variant_generator"},
+    }
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        _upgrade_hyperopt(hyperopt)
+
+    assert list(hyperopt["parameters"]) == [f"trainer.{name}" for name in param_names]
+    assert len([w for w in record if '"training" renamed' in str(w.message)]) == 1
+
+
+def test_upgrade_config_dicts_matches_single_upgrades(monkeypatch):
+    configs = [
+        {
+            "ludwig_version": ludwig_version,
+            INPUT_FEATURES: [{"name": "num_in", "type": "numerical"}],
+            OUTPUT_FEATURES: [{"name": "num_out", "type": "number"}],
+            TRAINING: {"epochs": epochs},
+        }
+        for ludwig_version in ("0.4", "0.5")
+        for epochs in (1, 2)
+    ]
+    expected_configs = [upgrade_config_dict_to_latest_version(config) for config in configs]
+
+    registry = backward_compatibility.config_transformation_registry
+    get_transformations = registry.get_transformations
+    requested_versions = []
+
+    def counting_get_transformations(from_version, to_version):
+        requested_versions.append(from_version)
+        return get_transformations(from_version, to_version)
+
+    monkeypatch.setattr(registry, "get_transformations", counting_get_transformations)
+    upgraded_configs = upgrade_config_dicts_to_latest_version(iter(configs))
+
+    assert upgraded_configs == expected_configs
+    # Transformations are only computed once for each ludwig_version in the batch.
+    assert requested_versions == ["0.4", "0.5"]
+    for upgraded_config, config in zip(upgraded_configs, configs):
+        assert TRAINING not in upgraded_config
+        assert upgraded_config[TRAINER]["epochs"] == config[TRAINING]["epochs"]
+        assert upgraded_config[INPUT_FEATURES][0][TYPE] == NUMBER
+        assert upgraded_config["ludwig_version"] == LUDWIG_VERSION
+
+
+def test_upgrade_hyperopt_unhashable_executor_type(monkeypatch):
+    monkeypatch.setattr(backward_compatibility, "_issued_deprecation_warnings", set())
+
+    hyperopt = {EXECUTOR: {TYPE: ["grid"]}, "search_alg": {TYPE: "variant_generator"}}
+    with pytest.warns(DeprecationWarning, match="not supported"):
+        _upgrade_hyperopt(hyperopt)
+
+    assert hyperopt[EXECUTOR][TYPE] == "ray"
+
+
+def test_training_section_deprecation_warned_once_across_upgrades(monkeypatch):
+    monkeypatch.setattr(backward_compatibility, "_issued_deprecation_warnings", set())
+
+    config = {
+        INPUT_FEATURES: [{"name": "num_in", "type": "number"}],
+        OUTPUT_FEATURES: [{"name": "num_out", "type": "number"}],
+        TRAINING: {"epochs": 2},
+        HYPEROPT: {
+            "parameters": {"training.learning_rate": {"space": "loguniform", "lower": 0.001, "upper": 0.1}},
+            EXECUTOR: {TYPE: "ray"},
+            "search_alg": {TYPE: "variant_generator"},
+        },
+    }
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        upgrade_config_dict_to_latest_version(config)
+
+    assert len([w for w in record if 'Config section "training" renamed' in str(w.message)]) == 1
+
+
+def test_upgrade_preprocessing_defaults_number_takes_precedence_over_numerical():
+    config = {
+        PREPROCESSING: {
+            "numerical": {"missing_value_strategy": "fill_with_mean"},
+            NUMBER: {"missing_value_strategy": "fill_with_const"},
+        },
+    }
+
+    with pytest.warns(UserWarning, match="Discarding `preprocessing.numerical`"):
+        _upgrade_preprocessing_defaults(config)
+
+    assert PREPROCESSING not in config
+    assert config[DEFAULTS] == {NUMBER: {PREPROCESSING: {"missing_value_strategy": "fill_with_const"}}}
+
+
+def test_upgrade_preprocessing_defaults_only_global_parameters_unchanged():
+    config = {PREPROCESSING: {"sample_ratio": 0.5}}
+
+    assert _upgrade_preprocessing_defaults(config) == {PREPROCESSING: {"sample_ratio": 0.5}}
+
+
+def test_upgrade_preprocessing_defaults_merges_into_existing_defaults():
+    defaults_preprocessing = {
+        "missing_value_strategy": "fill_with_const",
+        "fill_value": 0,
+        "outlier_handling": {"strategy": "zscore", "threshold": 3.0},
+    }
+    numerical_preprocessing = {
+        "missing_value_strategy": "fill_with_mean",
+        "outlier_handling": {"threshold": 2.5},
+    }
+    config = {
+        DEFAULTS: {NUMBER: {PREPROCESSING: copy.deepcopy(defaults_preprocessing)}},
+        PREPROCESSING: {"numerical": copy.deepcopy(numerical_preprocessing)},
+    }
+
+    _upgrade_preprocessing_defaults(config)
+
+    assert PREPROCESSING not in config
+    assert config[DEFAULTS][NUMBER][PREPROCESSING] == merge_dict(defaults_preprocessing, numerical_preprocessing)
+    assert config[DEFAULTS][NUMBER][PREPROCESSING] == {
+        "missing_value_strategy": "fill_with_mean",
+        "fill_value": 0,
+        "outlier_handling": {"strategy": "zscore", "threshold": 2.5},
+    }
@@ -0,0 +1,35 @@
+import copy
+from types import MappingProxyType
+
+from ludwig.utils.misc_utils import merge_dict, merge_dict_in_place
+
+
+def test_merge_dict_in_place():
+    nested = {"c": 1, "d": {"e": 2}}
+    dct = {"a": 1, "b": nested, "f": [1, 2], "g": 3}
+    merge_dct = {"a": 10, "b": {"d": {"x": 3}, "y": 4}, "f": {"z": 5}, "h": 6}
+    expected = merge_dict(dct, merge_dct)
+    original = copy.deepcopy(dct)
+
+    assert merge_dict_in_place(dct, merge_dct) is None
+
+    assert dct == expected
+    assert dct == {"a": 10, "b": {"c": 1, "d": {"e": 2, "x": 3}, "y": 4}, "f": {"z": 5}, "g": 3, "h": 6}
+    # Nested dicts are updated in-place rather than replaced.
+    assert dct["b"] is nested
+    assert original != dct
+
+
+def test_merge_dict_in_place_mapping_source():
+    # Any Mapping in the source is recursed into, but only when the destination value is a dict.
+    nested = {"c": 1}
+    dct = {"b": nested, "s": "string"}
+    merge_dct = {"b": MappingProxyType({"d": 2}), "s": MappingProxyType({"e": 3})}
+    expected = merge_dict(dct, merge_dct)
+
+    merge_dict_in_place(dct, merge_dct)
+
+    assert dct == expected
+    assert dct["b"] is nested
+    assert nested == {"c": 1, "d": 2}
+    assert dct["s"] is merge_dct["s"]